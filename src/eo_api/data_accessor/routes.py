@@ -1,7 +1,10 @@
 """FastAPI router exposing dataset endpoints."""
 
-from fastapi import APIRouter
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Query
 from fastapi.responses import FileResponse
+from pydantic import BeforeValidator
 from starlette.background import BackgroundTask
 
 from ..data_registry.routes import _get_dataset_or_404
@@ -9,17 +12,24 @@ from .services.accessor import cleanup_file, get_data, xarray_to_temporary_netcd
 
 router = APIRouter()
 
+# bbox bounds are validated declaratively, so out-of-range values are rejected before any data is opened
+Longitude = Annotated[float | None, Query(ge=-180, le=180)]
+Latitude = Annotated[float | None, Query(ge=-90, le=90)]
+
+# format names are matched case-insensitively, e.g. format=NetCDF
+RasterFormat = Annotated[Literal["netcdf"], BeforeValidator(str.lower)]
+
 
 @router.get("/{dataset_id}")
 def get_file(
     dataset_id: str,
     start: str,
     end: str,
-    xmin: float | None = None,
-    ymin: float | None = None,
-    xmax: float | None = None,
-    ymax: float | None = None,
-    format: str = "netcdf",
+    xmin: Longitude = None,
+    ymin: Latitude = None,
+    xmax: Longitude = None,
+    ymax: Latitude = None,
+    format: RasterFormat = "netcdf",
 ) -> FileResponse:
     """Get a dataset filtered to a timeperiod and bbox as a downloadable raster file."""
     dataset = _get_dataset_or_404(dataset_id)
@@ -32,13 +42,8 @@ def get_file(
         bbox = None
     ds = get_data(dataset, start, end, bbox)
 
-    # save to temporary file
-    if format.lower() == "netcdf":
-        # convert to netcdf
-        file_path = xarray_to_temporary_netcdf(ds)
-
-    else:
-        raise ValueError(f"Unsupported output format: {format}")
+    # save to temporary file (unsupported formats are rejected by request validation)
+    file_path = xarray_to_temporary_netcdf(ds)
 
     # return as file
     return FileResponse(
@@ -1,76 +1,131 @@
 """Loading raster data from downloaded files into xarray."""
 
+import contextlib
+import functools
 import logging
 import os
 import tempfile
+from collections.abc import Iterator, Mapping
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import xarray as xr
 
-from ...data_manager.services.downloader import get_cache_files, get_zarr_path
-from ...data_manager.services.utils import get_lon_lat_dims, get_time_dim
+from ...data_manager.services.downloader import get_cache_files, get_zarr_path, open_cache_files
+from ...data_manager.services.utils import get_lon_lat_dims, get_time_dim, is_unpacked_float64
 from ...shared.time import numpy_datetime_to_period_string
 
 logger = logging.getLogger(__name__)
 
+# the cache files a dataset handle was opened from, with their newest modification time
+CacheState = tuple[tuple[Path, ...], int]
+
+# one open zarr handle per dataset id, together with the cache state it was opened for; NetCDF
+# fallback files are never kept open, since open files block in-place rewrites by later downloads
+_ZARR_HANDLES: dict[str, tuple[CacheState, xr.Dataset]] = {}
+
+# subsets below this size are computed in one pass and written from memory
+IN_MEMORY_WRITE_LIMIT = 256 * 1024**2
+
+# encoding keys that describe how a variable is packed on disk
+_PACKING_KEYS = ("dtype", "scale_factor", "add_offset", "_FillValue")
+
 
 def get_data(
-    dataset: dict[str, Any],
+    dataset: Mapping[str, Any],
     start: str | None = None,
     end: str | None = None,
     bbox: list[float] | None = None,
 ) -> xr.Dataset:
     """Load an xarray raster dataset for a given time range and bbox."""
     logger.info("Opening dataset")
-    zarr_path = get_zarr_path(dataset)
-    if zarr_path:
-        logger.info(f"Using optimized zarr file: {zarr_path}")
-        ds = xr.open_zarr(zarr_path, consolidated=True)
-    else:
-        logger.warning(
-            f"Could not find optimized zarr file for dataset {dataset['id']}, using slower netcdf files instead."
-        )
-        files = get_cache_files(dataset)
-        ds = xr.open_mfdataset(
-            files,
-            data_vars="minimal",
-            coords="minimal",  # pyright: ignore[reportArgumentType]
-            compat="override",
-        )
+    state = _cache_state(dataset)
+    ds = _open_dataset(dataset["id"], state)
 
     if start and end:
         logger.info(f"Subsetting time to {start} and {end}")
-        time_dim = get_time_dim(ds)
-        ds = ds.sel(**{time_dim: slice(start, end)})  # pyright: ignore[reportArgumentType]
+        time_dim, _, _ = _get_dims(dataset["id"], state)
+        ds = ds.sel({time_dim: slice(start, end)})
 
     if bbox is not None:
         logger.info(f"Subsetting xy to {bbox}")
         xmin, ymin, xmax, ymax = list(map(float, bbox))
-        lon_dim, lat_dim = get_lon_lat_dims(ds)
+        _, lon_dim, lat_dim = _get_dims(dataset["id"], state)
         # TODO: this assumes y axis increases towards north and is not very stable
         # ...and also does not consider partial pixels at the edges
         # ...should probably switch to rioxarray.clip instead
-        ds = ds.sel(**{lon_dim: slice(xmin, xmax), lat_dim: slice(ymax, ymin)})  # pyright: ignore[reportArgumentType]
+        ds = ds.sel({lon_dim: slice(xmin, xmax), lat_dim: slice(ymax, ymin)})
 
-    return ds  # type: ignore[no-any-return]
+    return ds
 
 
-def get_data_coverage(dataset: dict[str, Any]) -> dict[str, Any]:
-    """Return temporal and spatial coverage metadata for downloaded data."""
-    ds = get_data(dataset)
+def _open_dataset(dataset_id: str, state: CacheState) -> xr.Dataset:
+    """Return the zarr handle opened for this cache state, or freshly opened NetCDF cache files."""
+    sources, _ = state
+    if not _is_zarr(sources):
+        return open_cache_files(list(sources))
 
-    if not ds:
-        return {"temporal_coverage": None, "spatial_coverage": None}
+    cached = _ZARR_HANDLES.get(dataset_id)
+    if cached is not None:
+        if cached[0] == state:
+            return cached[1]
+        cached[1].close()
+
+    ds: xr.Dataset = xr.open_zarr(sources[0], consolidated=True, chunks={})
+    _ZARR_HANDLES[dataset_id] = (state, ds)
+    return ds
+
+
+@contextlib.contextmanager
+def _opened_dataset(dataset_id: str, state: CacheState) -> Iterator[xr.Dataset]:
+    """Open a dataset for a metadata read, closing NetCDF cache files again afterwards."""
+    ds = _open_dataset(dataset_id, state)
+    try:
+        yield ds
+    finally:
+        if not _is_zarr(state[0]):
+            ds.close()
 
-    time_dim = get_time_dim(ds)
-    lon_dim, lat_dim = get_lon_lat_dims(ds)
 
-    start = numpy_datetime_to_period_string(ds[time_dim].min(), dataset["period_type"])  # type: ignore[arg-type]
-    end = numpy_datetime_to_period_string(ds[time_dim].max(), dataset["period_type"])  # type: ignore[arg-type]
+def _is_zarr(sources: tuple[Path, ...]) -> bool:
+    return len(sources) == 1 and sources[0].suffix == ".zarr"
 
-    xmin, xmax = ds[lon_dim].min().item(), ds[lon_dim].max().item()
-    ymin, ymax = ds[lat_dim].min().item(), ds[lat_dim].max().item()
 
+@functools.lru_cache(maxsize=32)
+def _get_dims(dataset_id: str, state: CacheState) -> tuple[str, str, str]:
+    """Resolve the time, lon and lat dimension names once per state of the cached files."""
+    with _opened_dataset(dataset_id, state) as ds:
+        lon_dim, lat_dim = get_lon_lat_dims(ds)
+        return get_time_dim(ds), lon_dim, lat_dim
+
+
+def _cache_state(dataset: Mapping[str, Any]) -> CacheState:
+    """Return the cached source files for a dataset and their newest modification time."""
+    zarr_path = get_zarr_path(dataset)
+    if zarr_path:
+        logger.info(f"Using optimized zarr file: {zarr_path}")
+        sources: tuple[Path, ...] = (zarr_path,)
+    else:
+        logger.warning(
+            f"Could not find optimized zarr file for dataset {dataset['id']}, using slower netcdf files instead."
+        )
+        sources = tuple(sorted(get_cache_files(dataset)))
+
+    # the newest modification time is part of the state so rewritten files are reopened
+    mtime_ns = max((path.stat().st_mtime_ns for path in sources), default=0)
+    return sources, mtime_ns
+
+
+def get_data_coverage(dataset: Mapping[str, Any]) -> dict[str, Any]:
+    """Return temporal and spatial coverage metadata for downloaded data."""
+    coverage = _compute_coverage(dataset["id"], _cache_state(dataset), dataset["period_type"])
+
+    if coverage is None:
+        return {"temporal_coverage": None, "spatial_coverage": None}
+
+    start, end, xmin, ymin, xmax, ymax = coverage
     return {
         "coverage": {
             "temporal": {"start": start, "end": end},
@@ -79,15 +134,63 @@ def get_data_coverage(dataset: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _compute_coverage(dataset_id: str, state: CacheState, period_type: str) -> tuple[Any, ...] | None:
+    """Compute coverage extents once per state of the cached files."""
+    with _opened_dataset(dataset_id, state) as ds:
+        if not ds:
+            return None
+
+        time_dim, lon_dim, lat_dim = _get_dims(dataset_id, state)
+
+        # read extents from the in-memory coordinate indexes instead of running xarray reductions
+        time_bounds = np.array(_index_bounds(ds.indexes[time_dim]), dtype="datetime64[ns]")
+        xmin, xmax = map(float, _index_bounds(ds.indexes[lon_dim]))
+        ymin, ymax = map(float, _index_bounds(ds.indexes[lat_dim]))
+
+    start, end = numpy_datetime_to_period_string(time_bounds, period_type)
+
+    return start, end, xmin, ymin, xmax, ymax
+
+
+def _index_bounds(index: pd.Index) -> tuple[Any, Any]:
+    """Return the smallest and largest value of a coordinate index."""
+    if index.is_monotonic_increasing:
+        return index[0], index[-1]
+    if index.is_monotonic_decreasing:
+        return index[-1], index[0]
+    return index.min(), index.max()
+
+
 def xarray_to_temporary_netcdf(ds: xr.Dataset) -> str:
     """Write a dataset to a temporary NetCDF file and return the path."""
     fd = tempfile.NamedTemporaryFile(suffix=".nc", delete=False)
     path = fd.name
     fd.close()
-    ds.to_netcdf(path)
+    if ds.nbytes < IN_MEMORY_WRITE_LIMIT:
+        # compute() returns a loaded copy, leaving a possibly shared lazy handle untouched
+        ds = ds.compute()
+    ds.to_netcdf(path, encoding=_netcdf_encoding(ds))
     return path
 
 
+def _netcdf_encoding(ds: xr.Dataset) -> dict[str, dict[str, Any]]:
+    """Return a lightly compressed encoding that stores unpacked float64 variables as float32."""
+    encoding: dict[str, dict[str, Any]] = {}
+    for name, var in ds.data_vars.items():
+        if var.dtype.kind not in "biuf":
+            continue
+        # keep any packing from the source, since an explicit encoding replaces the variable's own
+        var_encoding = {key: var.encoding[key] for key in _PACKING_KEYS if key in var.encoding}
+        # float32 halves the download size
+        if is_unpacked_float64(var):
+            var_encoding["dtype"] = "float32"
+        # zlib level 1 gives most of the size reduction of higher levels at a fraction of the CPU cost
+        var_encoding.update(zlib=True, complevel=1)
+        encoding[str(name)] = var_encoding
+    return encoding
+
+
 def cleanup_file(path: str) -> None:
     """Remove a file from disk."""
     os.remove(path)
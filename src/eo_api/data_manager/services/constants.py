@@ -1,17 +1,14 @@
 """Module-level constants loaded at import time (DHIS2 org units, bbox, env config)."""
 
-import json
 import os
 
-import geopandas as gpd
-
-from ...shared.dhis2_adapter import create_client, get_org_units_geojson
+from ...shared.dhis2_adapter import get_client, get_org_units_geojson
+from ...shared.geometry import features_bounds
 
 # load geojson from dhis2 at startup and keep in-memory
 # TODO: should probably save to file instead
-client = create_client()
-ORG_UNITS_GEOJSON = get_org_units_geojson(client, level=2)
-BBOX = list(map(float, gpd.read_file(json.dumps(ORG_UNITS_GEOJSON)).total_bounds))
+ORG_UNITS_GEOJSON = get_org_units_geojson(get_client(), level=2)
+BBOX = features_bounds(ORG_UNITS_GEOJSON["features"])
 
 # env variables we need from .env
 # TODO: should probably centralize to shared config module
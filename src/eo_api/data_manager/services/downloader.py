@@ -1,19 +1,24 @@
 """Dataset cache: download, store, and optimize raster data as local files."""
 
 import datetime
+import functools
 import importlib
 import inspect
 import logging
 import os
-from collections.abc import Callable
+import re
+import time
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import xarray as xr
 from fastapi import BackgroundTasks, HTTPException
 
-from ...shared.dhis2_adapter import create_client, get_org_units_geojson
-from .utils import get_lon_lat_dims, get_time_dim
+from ...shared.dhis2_adapter import get_client, get_org_units_geojson
+from ...shared.geometry import features_bounds
+from .utils import get_lon_lat_dims, get_time_dim, is_unpacked_float64
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +29,22 @@ if CACHE_OVERRIDE:
     _download_dir = Path(CACHE_OVERRIDE)
 DOWNLOAD_DIR = _download_dir
 
+# How long the DHIS2-derived default bbox is reused before org units are fetched again; 0 disables reuse
+DEFAULT_BBOX_TTL_SECONDS = float(os.getenv("DEFAULT_BBOX_TTL_SECONDS", "3600"))
+
+# four comma-separated numbers, optionally surrounded by whitespace
+_BBOX_NUMBER = r"\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)\s*"
+_BBOX_PATTERN = re.compile(",".join([_BBOX_NUMBER] * 4))
+
+# Time steps per dask chunk when reading the NetCDF cache directly
+NETCDF_TIME_CHUNK = 200
+
+# Time steps per zarr chunk, tuned for common temporal access patterns of each period type
+_TIME_CHUNKS = {"hourly": 24 * 7, "daily": 30, "monthly": 12, "yearly": 1}
+
 
 def download_dataset(
-    dataset: dict[str, Any],
+    dataset: Mapping[str, Any],
     start: str,
     end: str | None,
     bbox: list[float] | None,
@@ -50,11 +68,11 @@ def download_dataset(
         }
     )
 
-    sig = inspect.signature(eo_download_func)
+    accepted_params = _get_parameter_names(eo_download_func)
     try:
-        if "bbox" in sig.parameters:
+        if "bbox" in accepted_params:
             params["bbox"] = _resolve_bbox(bbox=bbox)
-        if "country_code" in sig.parameters:
+        if "country_code" in accepted_params:
             resolved_country_code = country_code or os.getenv("COUNTRY_CODE")
             if resolved_country_code:
                 params["country_code"] = resolved_country_code
@@ -72,7 +90,7 @@ def download_dataset(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     if background_tasks is not None:
-        background_tasks.add_task(eo_download_func, **params)
+        background_tasks.add_task(_run_background_download, dataset["id"], eo_download_func, params)
         return
 
     try:
@@ -86,13 +104,25 @@ def download_dataset(
         raise HTTPException(status_code=502, detail=f"Upstream dataset download failed: {message}") from exc
 
 
-def build_dataset_zarr(dataset: dict[str, Any]) -> None:
+def _run_background_download(
+    dataset_id: str,
+    eo_download_func: Callable[..., Any],
+    params: dict[str, Any],
+) -> None:
+    """Run a queued download, logging failures together with the dataset they belong to."""
+    try:
+        eo_download_func(**params)
+    except Exception:
+        logger.exception(f"Background download failed for dataset {dataset_id}")
+
+
+def build_dataset_zarr(dataset: Mapping[str, Any]) -> None:
     """Collect all dataset files into a single optimised zarr archive."""
     logger.info(f"Optimizing cache for dataset {dataset['id']}")
 
     files = get_cache_files(dataset)
     logger.info(f"Opening {len(files)} files from cache")
-    ds = xr.open_mfdataset(files)
+    ds = open_cache_files(files)
 
     # trim to only minimal vars and coords
     logger.info("Trimming unnecessary variables and coordinates")
@@ -102,6 +132,11 @@ def build_dataset_zarr(dataset: dict[str, Any]) -> None:
     drop_coords = [c for c in ds.coords if c not in keep_coords]
     ds = ds.drop_vars(drop_coords)
 
+    # float32 halves the archive size and the bandwidth of every later read
+    if is_unpacked_float64(ds[varname]):
+        logger.info("Casting float64 values to float32")
+        ds[varname] = ds[varname].astype(np.float32)
+
     # determine optimal chunk sizes
     logger.info("Determining optimal chunk size for zarr archive")
     ds_autochunk = ds.chunk("auto").unify_chunks()
@@ -114,7 +149,7 @@ def build_dataset_zarr(dataset: dict[str, Any]) -> None:
     logger.info("Saving to optimized zarr file")
     zarr_path = DOWNLOAD_DIR / f"{_get_cache_prefix(dataset)}.zarr"
     ds_chunked = ds.chunk(uniform_chunks)
-    ds_chunked.to_zarr(zarr_path, mode="w")
+    ds_chunked.to_zarr(zarr_path, mode="w", consolidated=True)
     ds_chunked.close()
 
     logger.info("Finished cache optimization")
@@ -122,22 +157,15 @@ def build_dataset_zarr(dataset: dict[str, Any]) -> None:
 
 def _compute_time_space_chunks(
     ds: xr.Dataset,
-    dataset: dict[str, Any],
+    dataset: Mapping[str, Any],
     max_spatial_chunk: int = 256,
 ) -> dict[str, int]:
     """Compute chunk sizes tuned for common temporal access patterns."""
     chunks: dict[str, int] = {}
 
-    dim = get_time_dim(ds)
-    period_type = dataset["period_type"]
-    if period_type == "hourly":
-        chunks[dim] = 24 * 7
-    elif period_type == "daily":
-        chunks[dim] = 30
-    elif period_type == "monthly":
-        chunks[dim] = 12
-    elif period_type == "yearly":
-        chunks[dim] = 1
+    time_chunk = _TIME_CHUNKS.get(dataset["period_type"])
+    if time_chunk is not None:
+        chunks[get_time_dim(ds)] = time_chunk
 
     lon_dim, lat_dim = get_lon_lat_dims(ds)
     chunks[lon_dim] = min(ds.sizes[lon_dim], max_spatial_chunk)
@@ -146,18 +174,43 @@ def _compute_time_space_chunks(
     return chunks
 
 
-def _get_cache_prefix(dataset: dict[str, Any]) -> str:
+def _get_cache_prefix(dataset: Mapping[str, Any]) -> str:
     return str(dataset["id"])
 
 
-def get_cache_files(dataset: dict[str, Any]) -> list[Path]:
+def get_cache_files(dataset: Mapping[str, Any]) -> list[Path]:
     """Return all NetCDF cache files matching this dataset's prefix."""
     # TODO: not bulletproof -- e.g. 2m_temperature matches 2m_temperature_modified
     prefix = _get_cache_prefix(dataset)
-    return list(DOWNLOAD_DIR.glob(f"{prefix}*.nc"))
+    if not DOWNLOAD_DIR.is_dir():
+        return []
+    # scandir with plain string checks avoids glob's pattern matching and per-entry Path objects
+    with os.scandir(DOWNLOAD_DIR) as entries:
+        return [
+            DOWNLOAD_DIR / entry.name
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".nc")
+        ]
+
+
+def open_cache_files(files: list[Path]) -> xr.Dataset:
+    """Open NetCDF cache files as one dataset, reading file headers in parallel."""
+    chunks: dict[str, int] = {}
+    if files:
+        # peek at one file without decoding to learn the time dimension name
+        with xr.open_dataset(files[0], decode_cf=False) as first:
+            chunks[get_time_dim(first)] = NETCDF_TIME_CHUNK
+    return xr.open_mfdataset(
+        files,
+        data_vars="minimal",
+        coords="minimal",  # pyright: ignore[reportArgumentType]
+        compat="override",
+        parallel=True,
+        chunks=chunks,
+    )
 
 
-def get_zarr_path(dataset: dict[str, Any]) -> Path | None:
+def get_zarr_path(dataset: Mapping[str, Any]) -> Path | None:
     """Return the optimised zarr archive path if it exists."""
     prefix = _get_cache_prefix(dataset)
     optimized = DOWNLOAD_DIR / f"{prefix}.zarr"
@@ -166,23 +219,38 @@ def get_zarr_path(dataset: dict[str, Any]) -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _get_dynamic_function(full_path: str) -> Callable[..., Any]:
     """Import and return a function given its dotted module path."""
-    parts = full_path.split(".")
-    module_path = ".".join(parts[:-1])
-    function_name = parts[-1]
+    module_path, _, function_name = full_path.rpartition(".")
     module = importlib.import_module(module_path)
     return getattr(module, function_name)  # type: ignore[no-any-return]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_parameter_names(func: Callable[..., Any]) -> frozenset[str]:
+    """Return the parameter names accepted by a download function."""
+    return frozenset(inspect.signature(func).parameters)
+
+
 def _get_default_bbox() -> list[float]:
     """Compute the default download bbox from DHIS2 org units when needed."""
-    import geopandas as gpd
+    if DEFAULT_BBOX_TTL_SECONDS <= 0:
+        return list(_fetch_default_bbox_uncached())
+    # the time bucket is part of the cache key, so org unit changes in DHIS2 are picked up after the TTL
+    return list(_fetch_default_bbox(int(time.monotonic() // DEFAULT_BBOX_TTL_SECONDS)))
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_default_bbox(ttl_bucket: int) -> tuple[float, ...]:
+    """Fetch and parse the DHIS2 org unit GeoJSON once per TTL period."""
+    return _fetch_default_bbox_uncached()
+
 
-    client = create_client()
-    org_units_geojson = get_org_units_geojson(client, level=2)
-    gdf = gpd.GeoDataFrame.from_features(org_units_geojson.get("features", []))
-    return list(map(float, gdf.total_bounds))
+def _fetch_default_bbox_uncached() -> tuple[float, ...]:
+    """Fetch the DHIS2 org unit GeoJSON and return the bounds of its features."""
+    org_units_geojson = get_org_units_geojson(get_client(), level=2)
+    return tuple(features_bounds(org_units_geojson.get("features", [])))
 
 
 def _resolve_bbox(*, bbox: list[float] | None) -> list[float]:
@@ -208,7 +276,10 @@ def _bbox_from_env() -> list[float] | None:
     if not raw_bbox:
         return None
 
-    parts = [part.strip() for part in raw_bbox.split(",")]
-    if len(parts) != 4:
+    match = _BBOX_PATTERN.fullmatch(raw_bbox)
+    if match is None:
         raise ValueError("DOWNLOAD_BBOX must contain four comma-separated numbers: xmin,ymin,xmax,ymax")
-    return [float(part) for part in parts]
+    xmin, ymin, xmax, ymax = map(float, match.groups())
+    if xmin > xmax or ymin > ymax:
+        raise ValueError("DOWNLOAD_BBOX must be ordered as xmin,ymin,xmax,ymax")
+    return [xmin, ymin, xmax, ymax]
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+import numpy as np
+
 
 def get_time_dim(ds: Any) -> str:
     """Return the name of the time dimension in a dataset or dataframe."""
@@ -17,3 +19,9 @@ def get_lon_lat_dims(ds: Any) -> tuple[str, str]:
         if hasattr(ds, lat_name):
             return lon_name, lat_name
     raise ValueError(f"Unable to find space dimension: {ds.coordinates}")
+
+
+def is_unpacked_float64(variable: Any) -> bool:
+    """Return whether a variable holds float64 values that are not packed into another dtype on disk."""
+    # such values can be stored as float32, which still exceeds the precision of the source products
+    return bool(variable.dtype == np.float64 and np.dtype(variable.encoding.get("dtype", np.float64)) == np.float64)
@@ -1,5 +1,6 @@
 """FastAPI router exposing dataset template endpoints."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
@@ -10,12 +11,12 @@ router = APIRouter()
 
 
 @router.get("/")
-def list_dataset_templates() -> list[dict[str, Any]]:
+def list_dataset_templates() -> list[Mapping[str, Any]]:
     """Return the available dataset templates from the registry."""
     return datasets.list_datasets()
 
 
-def _get_dataset_or_404(dataset_id: str) -> dict[str, Any]:
+def _get_dataset_or_404(dataset_id: str) -> Mapping[str, Any]:
     """Look up a dataset template by ID or raise 404."""
     dataset = datasets.get_dataset(dataset_id)
     if not dataset:
@@ -31,5 +32,4 @@ def get_dataset_template(dataset_id: str) -> dict[str, Any]:
 
     dataset = _get_dataset_or_404(dataset_id)
     coverage = get_data_coverage(dataset)
-    dataset.update(coverage)
-    return dataset
+    return {**dataset, **coverage}
@@ -1,37 +1,70 @@
 """Dataset registry backed by YAML config files."""
 
+import functools
 import logging
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml
+from ...shared.yaml_io import load_yaml
 
 logger = logging.getLogger(__name__)
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 CONFIGS_DIR = SCRIPT_DIR.parent.parent.parent.parent / "data" / "datasets"
 
+# registry files by name and modification time, used to detect edits to the registry
+RegistryState = tuple[tuple[str, int], ...]
 
-def list_datasets() -> list[dict[str, Any]]:
+
+def list_datasets() -> list[Mapping[str, Any]]:
     """Load all YAML files in the registry folder and return a flat list of datasets."""
-    datasets: list[dict[str, Any]] = []
+    datasets, _ = _load_registry(_registry_state())
+    return list(datasets)
+
+
+def get_dataset(dataset_id: str) -> Mapping[str, Any] | None:
+    """Get the dataset for a given id as a read-only view of the cached registry entry."""
+    _, datasets_lookup = _load_registry(_registry_state())
+    return datasets_lookup.get(dataset_id)
+
+
+def get_registry_files() -> list[Path]:
+    """Return the YAML files that make up the registry."""
     folder = CONFIGS_DIR
 
     if not folder.is_dir():
         raise ValueError(f"Path is not a directory: {folder}")
 
-    for file_path in folder.glob("*.y*ml"):
+    return sorted(folder.glob("*.y*ml"))
+
+
+def _registry_state() -> RegistryState:
+    """Return the current registry files with their modification times."""
+    return tuple((file_path.name, file_path.stat().st_mtime_ns) for file_path in get_registry_files())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_registry(state: RegistryState) -> tuple[tuple[Mapping[str, Any], ...], dict[str, Mapping[str, Any]]]:
+    """Parse the registry files once per registry state and index the datasets by id."""
+    datasets: list[dict[str, Any]] = []
+
+    for file_name, _ in state:
         try:
-            with open(file_path, encoding="utf-8") as f:
-                file_datasets = yaml.safe_load(f)
+            with open(CONFIGS_DIR / file_name, encoding="utf-8") as f:
+                file_datasets = load_yaml(f)
                 datasets.extend(file_datasets)
         except Exception:
-            logger.exception("Error loading %s", file_path.name)
-
-    return datasets
+            logger.exception("Error loading %s", file_name)
 
+    # entries are shared between requests, so hand out read-only views
+    views = tuple(MappingProxyType(d) for d in datasets)
 
-def get_dataset(dataset_id: str) -> dict[str, Any] | None:
-    """Get dataset dict for a given id."""
-    datasets_lookup = {d["id"]: d for d in list_datasets()}
-    return datasets_lookup.get(dataset_id)
+    datasets_lookup: dict[str, Mapping[str, Any]] = {}
+    for dataset in views:
+        if "id" not in dataset:
+            logger.warning("Skipping registry dataset without an id: %s", dataset.get("name", "<unnamed>"))
+            continue
+        datasets_lookup[dataset["id"]] = dataset
+    return views, datasets_lookup
@@ -1,5 +1,7 @@
 """FastAPI routes for configured extent discovery."""
 
+from collections.abc import Mapping
+
 from fastapi import APIRouter
 
 from eo_api.extents import services
@@ -21,7 +23,7 @@ def get_extent(extent_id: str) -> ExtentRecord:
     return _build_extent_record(services.get_extent_or_404(extent_id))
 
 
-def _build_extent_record(extent: dict[str, object]) -> ExtentRecord:
+def _build_extent_record(extent: Mapping[str, object]) -> ExtentRecord:
     bbox = extent.get("bbox")
     if not (isinstance(bbox, list) and len(bbox) == 4 and all(isinstance(value, int | float) for value in bbox)):
         raise ValueError(f"Invalid bbox in extent config for '{extent.get('id')}'")
@@ -1,27 +1,41 @@
 """Extent registry backed by YAML config files."""
 
+import functools
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml
 from fastapi import HTTPException
 
+from ..shared.yaml_io import load_yaml
+
 SCRIPT_DIR = Path(__file__).parent.resolve()
 EXTENTS_PATH = SCRIPT_DIR.parent.parent.parent / "data" / "extents.yaml"
 
 
-def list_extents() -> list[dict[str, Any]]:
+def list_extents() -> list[Mapping[str, Any]]:
     """Return configured extents for this EO API instance."""
-    if not EXTENTS_PATH.exists():
+    try:
+        mtime_ns = EXTENTS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
-    payload = yaml.safe_load(EXTENTS_PATH.read_text(encoding="utf-8")) or {}
+    return list(_load_extents(mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_extents(mtime_ns: int) -> tuple[Mapping[str, Any], ...]:
+    """Parse the extents file once per modification time."""
+    del mtime_ns  # only used as part of the cache key
+    payload = load_yaml(EXTENTS_PATH.read_text(encoding="utf-8")) or {}
     extents = payload.get("extents", [])
     if not isinstance(extents, list):
         raise ValueError(f"Expected 'extents' list in {EXTENTS_PATH}")
-    return [extent for extent in extents if isinstance(extent, dict)]
+    # extents are shared between requests, so hand out read-only views
+    return tuple(MappingProxyType(extent) for extent in extents if isinstance(extent, dict))
 
 
-def get_extent_or_404(extent_id: str) -> dict[str, Any]:
+def get_extent_or_404(extent_id: str) -> Mapping[str, Any]:
     """Return one configured extent or raise 404."""
     for extent in list_extents():
         if extent.get("id") == extent_id:
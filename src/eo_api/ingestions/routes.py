@@ -1,6 +1,6 @@
 """Routes for EO ingestion, datasets, and sync operations."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse
 from starlette.responses import Response
 
@@ -14,7 +14,9 @@ from eo_api.ingestions.schemas import (
     IngestionResponse,
     SyncDatasetRequest,
     SyncResponse,
+    ZarrListing,
 )
+from eo_api.shared.http import is_not_modified, not_modified_response, set_cache_validators
 
 ingestions_router = APIRouter()
 datasets_router = APIRouter()
@@ -63,15 +65,24 @@ def get_ingestion(ingestion_id: str) -> IngestionResponse:
 
 
 @datasets_router.get("", response_model=DatasetListResponse)
-def list_datasets() -> DatasetListResponse:
+def list_datasets(request: Request, response: Response) -> DatasetListResponse | Response:
     """List managed datasets."""
+    etag = services.get_datasets_etag()
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_validators(response, etag)
     return services.list_datasets()
 
 
 @datasets_router.get("/{dataset_id}", response_model=DatasetDetailRecord)
-def get_dataset(dataset_id: str) -> DatasetDetailRecord:
+def get_dataset(dataset_id: str, request: Request, response: Response) -> DatasetDetailRecord | Response:
     """Get managed dataset metadata and available versions."""
-    return services.get_dataset_or_404(dataset_id)
+    dataset = services.get_dataset_or_404(dataset_id)
+    etag = services.get_dataset_etag(dataset_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_cache_validators(response, etag)
+    return dataset
 
 
 @datasets_router.get("/{dataset_id}/download")
@@ -89,16 +100,16 @@ def download_artifact_file(dataset_id: str) -> FileResponse:
     return FileResponse(artifact.path, media_type=media_type, filename=filename)
 
 
-@zarr_router.get("/{dataset_id}")
-def get_canonical_zarr_store_info(dataset_id: str) -> dict[str, object]:
+@zarr_router.get("/{dataset_id}", response_model=ZarrListing, response_model_exclude_none=True)
+def get_canonical_zarr_store_info(dataset_id: str) -> ZarrListing:
     """Return canonical Zarr store listing for a managed dataset."""
     return services.get_dataset_zarr_store_info_or_404(dataset_id)
 
 
 @zarr_router.get("/{dataset_id}/{relative_path:path}", response_model=None)
-def get_canonical_zarr_store_file(dataset_id: str, relative_path: str) -> FileResponse | Response | dict[str, object]:
+def get_canonical_zarr_store_file(dataset_id: str, relative_path: str, request: Request) -> FileResponse | Response:
     """Serve canonical Zarr store content for a managed dataset."""
-    return services.get_dataset_zarr_store_file_or_404(dataset_id, relative_path)
+    return services.get_dataset_zarr_store_file_or_404(dataset_id, relative_path, request)
 
 
 @sync_router.post("/{dataset_id}", response_model=SyncResponse)
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ArtifactFormat(StrEnum):
@@ -23,6 +23,8 @@ class PublicationStatus(StrEnum):
 class CoverageSpatial(BaseModel):
     """Spatial extent summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     xmin: float = Field(description="Minimum longitude of the covered spatial extent.")
     ymin: float = Field(description="Minimum latitude of the covered spatial extent.")
     xmax: float = Field(description="Maximum longitude of the covered spatial extent.")
@@ -32,6 +34,8 @@ class CoverageSpatial(BaseModel):
 class CoverageTemporal(BaseModel):
     """Temporal extent summary."""
 
+    model_config = ConfigDict(frozen=True)
+
     start: str = Field(description="First covered time period in dataset-native string form.")
     end: str = Field(description="Last covered time period in dataset-native string form.")
 
@@ -39,6 +43,8 @@ class CoverageTemporal(BaseModel):
 class ArtifactCoverage(BaseModel):
     """Artifact coverage metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     spatial: CoverageSpatial = Field(description="Covered spatial extent of the managed dataset.")
     temporal: CoverageTemporal = Field(description="Covered temporal extent of the managed dataset.")
 
@@ -46,6 +52,8 @@ class ArtifactCoverage(BaseModel):
 class ArtifactRequestScope(BaseModel):
     """Original request parameters used to create an artifact."""
 
+    model_config = ConfigDict(frozen=True)
+
     start: str = Field(description="Requested start period for the ingestion or sync operation.")
     end: str | None = Field(default=None, description="Requested end period for the ingestion or sync operation.")
     extent_id: str | None = Field(
@@ -61,6 +69,8 @@ class ArtifactRequestScope(BaseModel):
 class ArtifactPublication(BaseModel):
     """Publication metadata for an artifact."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: PublicationStatus = PublicationStatus.UNPUBLISHED
     collection_id: str | None = None
     published_at: datetime | None = None
@@ -70,6 +80,9 @@ class ArtifactPublication(BaseModel):
 class ArtifactRecord(BaseModel):
     """Stored artifact metadata."""
 
+    # frozen, since parsed records are cached and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     artifact_id: str
     dataset_id: str
     dataset_name: str
@@ -235,6 +248,24 @@ class DatasetListResponse(BaseModel):
     )
 
 
+class ZarrEntry(BaseModel):
+    """Entry of a Zarr store directory listing."""
+
+    name: str = Field(description="Name of the file or directory within the listed directory.")
+    kind: str = Field(description="Entry type, either file or directory.")
+    href: str = Field(description="Link to the entry within the dataset Zarr store.")
+
+
+class ZarrListing(BaseModel):
+    """Browseable listing of a directory within a dataset Zarr store."""
+
+    kind: str = Field(default="ZarrListing", description="Self-describing envelope type for this listing.")
+    dataset_id: str = Field(description="Managed dataset identifier the Zarr store belongs to.")
+    format: ArtifactFormat | None = Field(default=None, description="Stored artifact format, set on the store root.")
+    path: str = Field(description="Listed directory relative to the store root.")
+    entries: list[ZarrEntry] = Field(default_factory=list, description="Files and directories in the listed path.")
+
+
 class SyncDatasetRequest(BaseModel):
     """Request payload for syncing a managed dataset forward."""
 
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import fcntl
+import functools
 import json
 import logging
 import mimetypes
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 from uuid import uuid4
 
-from fastapi import HTTPException
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse
+from pydantic import TypeAdapter, ValidationError
 from starlette.responses import Response
 
 from eo_api.data_accessor.services.accessor import get_data_coverage
@@ -36,8 +40,11 @@ from eo_api.ingestions.schemas import (
     DatasetVersionRecord,
     PublicationStatus,
     SyncResponse,
+    ZarrEntry,
+    ZarrListing,
 )
 from eo_api.publications.services import managed_dataset_id_for, publish_artifact
+from eo_api.shared.http import etag_for_files, is_not_modified, not_modified_response, set_cache_validators
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +52,11 @@ DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data"
 ARTIFACTS_DIR = DATA_DIR / "artifacts"
 ARTIFACTS_INDEX_PATH = ARTIFACTS_DIR / "records.json"
 
+_RECORDS_ADAPTER = TypeAdapter(list[ArtifactRecord])
+
+# Zarr v2 and v3 metadata documents, which are served as JSON rather than as binary chunks
+_ZARR_METADATA_FILES = frozenset({".zarray", ".zattrs", ".zgroup", "zarr.json"})
+
 
 def ensure_store() -> None:
     """Create the artifact metadata store if it does not exist."""
@@ -60,10 +72,11 @@ def list_artifacts() -> ArtifactListResponse:
 
 def get_artifact_or_404(artifact_id: str) -> ArtifactRecord:
     """Return a single artifact or raise 404."""
-    for record in _load_records():
-        if record.artifact_id == artifact_id:
-            return record
-    raise HTTPException(status_code=404, detail=f"Artifact '{artifact_id}' not found")
+    _, records_by_id = _cached_records()
+    record = records_by_id.get(artifact_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Artifact '{artifact_id}' not found")
+    return record
 
 
 def get_dataset_for_artifact_or_404(artifact_id: str) -> DatasetDetailRecord:
@@ -89,6 +102,22 @@ def list_datasets() -> DatasetListResponse:
     return DatasetListResponse(items=items)
 
 
+def get_datasets_etag() -> str:
+    """Return an ETag that changes whenever the artifact index or the dataset registry changes."""
+    return etag_for_files(_dataset_source_files())
+
+
+def get_dataset_etag(dataset_id: str) -> str:
+    """Return an ETag for one managed dataset, distinct from the list ETag and from other datasets."""
+    return etag_for_files(_dataset_source_files(), scope=dataset_id)
+
+
+def _dataset_source_files() -> list[Path]:
+    """Return the files that managed dataset views are built from."""
+    ensure_store()
+    return [ARTIFACTS_INDEX_PATH, *registry_datasets.get_registry_files()]
+
+
 def get_dataset_or_404(dataset_id: str) -> DatasetDetailRecord:
     """Return one managed dataset or raise 404."""
     grouped = _group_datasets()
@@ -109,7 +138,7 @@ def get_latest_artifact_for_dataset_or_404(dataset_id: str) -> ArtifactRecord:
 
 def create_artifact(
     *,
-    dataset: dict[str, object],
+    dataset: Mapping[str, object],
     start: str,
     end: str | None,
     extent_id: str | None,
@@ -253,24 +282,18 @@ def sync_dataset(
     )
 
 
-def get_dataset_zarr_store_info_or_404(dataset_id: str) -> dict[str, object]:
+def get_dataset_zarr_store_info_or_404(dataset_id: str) -> ZarrListing:
     """Return a public Zarr store listing for a managed dataset."""
     artifact = get_latest_artifact_for_dataset_or_404(dataset_id)
     store_root = _get_zarr_root_or_409(artifact)
 
     entries = _zarr_entries(dataset_id=dataset_id, store_root=store_root, directory=store_root)
-    return {
-        "kind": "ZarrListing",
-        "dataset_id": dataset_id,
-        "format": artifact.format,
-        "path": ".",
-        "entries": entries,
-    }
+    return ZarrListing(dataset_id=dataset_id, format=artifact.format, path=".", entries=entries)
 
 
 def get_dataset_zarr_store_file_or_404(
-    dataset_id: str, relative_path: str
-) -> FileResponse | Response | dict[str, object]:
+    dataset_id: str, relative_path: str, request: Request
+) -> FileResponse | Response:
     """Serve a file, metadata document, or directory listing within a dataset Zarr store."""
     artifact = get_latest_artifact_for_dataset_or_404(dataset_id)
     store_root = _get_zarr_root_or_409(artifact)
@@ -278,26 +301,71 @@ def get_dataset_zarr_store_file_or_404(
     if not target.exists():
         raise HTTPException(status_code=404, detail=f"Zarr path '{relative_path}' not found")
     if target.is_dir():
-        return _zarr_directory_listing(dataset_id=dataset_id, store_root=store_root, directory=target)
-    if target.name in {".zarray", ".zattrs", ".zgroup", "zarr.json"}:
-        return JSONResponse(content=json.loads(target.read_text(encoding="utf-8")))
-
-    media_type, _ = mimetypes.guess_type(target.name)
-    if media_type is None:
-        media_type = "application/octet-stream"
-    return FileResponse(target, media_type=media_type, filename=target.name)
+        listing = _zarr_directory_listing(dataset_id=dataset_id, store_root=store_root, directory=target)
+        # serialized by pydantic directly, since this route mixes file and JSON responses
+        return Response(content=listing.model_dump_json(exclude_none=True), media_type="application/json")
+
+    # Zarr clients re-read metadata and chunks often, so let them revalidate instead of downloading again
+    etag = etag_for_files([target])
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    response: Response
+    if target.name in _ZARR_METADATA_FILES:
+        # metadata documents are already JSON on disk, so serve the bytes as-is
+        response = Response(content=target.read_bytes(), media_type="application/json")
+    else:
+        media_type, _ = mimetypes.guess_type(target.name)
+        if media_type is None:
+            media_type = "application/octet-stream"
+        response = FileResponse(target, media_type=media_type, filename=target.name)
+    set_cache_validators(response, etag)
+    return response
 
 
 def _load_records() -> list[ArtifactRecord]:
+    records, _ = _cached_records()
+    return list(records)
+
+
+def _cached_records() -> tuple[tuple[ArtifactRecord, ...], dict[str, ArtifactRecord]]:
+    """Return the parsed artifact index for the current version of the file on disk."""
     ensure_store()
-    raw = json.loads(ARTIFACTS_INDEX_PATH.read_text(encoding="utf-8"))
-    return [ArtifactRecord.model_validate(_upgrade_legacy_record(item)) for item in raw]
+    stat = ARTIFACTS_INDEX_PATH.stat()
+    return _read_records(ARTIFACTS_INDEX_PATH, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_records(
+    index_path: Path, mtime_ns: int, size: int
+) -> tuple[tuple[ArtifactRecord, ...], dict[str, ArtifactRecord]]:
+    """Parse the artifact index once per version of the file on disk and index the records by id."""
+    # records are frozen models, so they can be shared between callers
+    records = tuple(_parse_records(index_path.read_bytes()))
+    records_by_id: dict[str, ArtifactRecord] = {}
+    for record in records:
+        # the first record wins, matching a scan of the index in order
+        records_by_id.setdefault(record.artifact_id, record)
+    return records, records_by_id
+
+
+def _parse_records(raw: bytes) -> list[ArtifactRecord]:
+    """Parse and validate the artifact index in a single pass, upgrading legacy records if needed."""
+    try:
+        return _RECORDS_ADAPTER.validate_json(raw or b"[]")
+    except ValidationError:
+        # records written before schema migrations need backfilling before validation
+        return [ArtifactRecord.model_validate(_upgrade_legacy_record(item)) for item in json.loads(raw)]
 
 
 def _save_records(records: list[ArtifactRecord]) -> None:
     ensure_store()
-    payload = [record.model_dump(mode="json") for record in records]
-    ARTIFACTS_INDEX_PATH.write_text(f"{json.dumps(payload, indent=2)}\n", encoding="utf-8")
+    ARTIFACTS_INDEX_PATH.write_bytes(_dump_records(records))
+
+
+def _dump_records(records: list[ArtifactRecord]) -> bytes:
+    """Serialize artifact records to JSON bytes in a single pass."""
+    return _RECORDS_ADAPTER.dump_json(records, indent=2) + b"\n"
 
 
 def _store_artifact_record(
@@ -329,16 +397,15 @@ def _store_artifact_record(
 def _mutate_records(mutation: Callable[[list[ArtifactRecord]], ArtifactRecord]) -> ArtifactRecord:
     """Apply a read-modify-write mutation under an exclusive file lock."""
     ensure_store()
-    with ARTIFACTS_INDEX_PATH.open("a+", encoding="utf-8") as handle:
+    with ARTIFACTS_INDEX_PATH.open("a+b") as handle:
         fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
         handle.seek(0)
         raw = handle.read()
-        records = [ArtifactRecord.model_validate(_upgrade_legacy_record(item)) for item in json.loads(raw or "[]")]
+        records = _parse_records(raw)
         result = mutation(records)
-        payload = [record.model_dump(mode="json") for record in records]
         handle.seek(0)
         handle.truncate()
-        handle.write(f"{json.dumps(payload, indent=2)}\n")
+        handle.write(_dump_records(records))
         handle.flush()
         os.fsync(handle.fileno())
         fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
@@ -366,26 +433,21 @@ def _resolve_zarr_path(store_root: Path, relative_path: str) -> Path:
     return candidate
 
 
-def _zarr_directory_listing(*, dataset_id: str, store_root: Path, directory: Path) -> dict[str, object]:
+def _zarr_directory_listing(*, dataset_id: str, store_root: Path, directory: Path) -> ZarrListing:
     """Return a browseable directory listing for a Zarr path."""
     relative_directory = "." if directory == store_root else directory.relative_to(store_root).as_posix()
     entries = _zarr_entries(dataset_id=dataset_id, store_root=store_root, directory=directory)
-    return {
-        "kind": "ZarrListing",
-        "dataset_id": dataset_id,
-        "path": relative_directory,
-        "entries": entries,
-    }
+    return ZarrListing(dataset_id=dataset_id, path=relative_directory, entries=entries)
 
 
-def _zarr_entries(*, dataset_id: str, store_root: Path, directory: Path) -> list[dict[str, str]]:
+def _zarr_entries(*, dataset_id: str, store_root: Path, directory: Path) -> list[ZarrEntry]:
     """Build directory entries for a Zarr store namespace."""
     return [
-        {
-            "name": child.name,
-            "kind": "directory" if child.is_dir() else "file",
-            "href": f"/zarr/{dataset_id}/{child.relative_to(store_root).as_posix()}",
-        }
+        ZarrEntry(
+            name=child.name,
+            kind="directory" if child.is_dir() else "file",
+            href=f"/zarr/{dataset_id}/{child.relative_to(store_root).as_posix()}",
+        )
         for child in sorted(directory.iterdir(), key=lambda child: child.name)
     ]
 
@@ -425,34 +487,14 @@ def _find_existing_artifact_in_records(
 
 
 def _build_dataset_record(dataset_id: str, artifacts: list[ArtifactRecord]) -> DatasetRecord:
-    latest = max(artifacts, key=lambda artifact: artifact.created_at)
-    source_dataset = registry_datasets.get_dataset(latest.dataset_id) or {}
-    return DatasetRecord(
-        dataset_id=dataset_id,
-        source_dataset_id=latest.dataset_id,
-        dataset_name=latest.dataset_name,
-        short_name=_as_optional_str(source_dataset.get("short_name")),
-        variable=latest.variable,
-        period_type=_as_optional_str(source_dataset.get("period_type")) or "unknown",
-        units=_as_optional_str(source_dataset.get("units")),
-        resolution=_as_optional_str(source_dataset.get("resolution")),
-        source=_as_optional_str(source_dataset.get("source")),
-        source_url=_as_optional_str(source_dataset.get("source_url")),
-        extent=latest.coverage,
-        last_updated=latest.created_at,
-        links=_dataset_links(dataset_id, latest),
-        publication=DatasetPublication(
-            status=latest.publication.status,
-            published_at=latest.publication.published_at,
-        ),
-    )
+    return DatasetRecord(**_dataset_record_fields(dataset_id, artifacts))
 
 
 def _build_dataset_detail_record(dataset_id: str, artifacts: list[ArtifactRecord]) -> DatasetDetailRecord:
-    base = _build_dataset_record(dataset_id, artifacts)
     ordered_artifacts = sorted(artifacts, key=lambda artifact: artifact.created_at, reverse=True)
+    # built from the same fields as the summary, rather than dumping and re-validating a summary record
     return DatasetDetailRecord(
-        **base.model_dump(),
+        **_dataset_record_fields(dataset_id, artifacts),
         versions=[
             DatasetVersionRecord(
                 created_at=artifact.created_at,
@@ -465,6 +507,31 @@ def _build_dataset_detail_record(dataset_id: str, artifacts: list[ArtifactRecord
     )
 
 
+def _dataset_record_fields(dataset_id: str, artifacts: list[ArtifactRecord]) -> dict[str, Any]:
+    """Return the fields shared by the summary and detail views of a managed dataset."""
+    latest = max(artifacts, key=lambda artifact: artifact.created_at)
+    source_dataset = registry_datasets.get_dataset(latest.dataset_id) or {}
+    return {
+        "dataset_id": dataset_id,
+        "source_dataset_id": latest.dataset_id,
+        "dataset_name": latest.dataset_name,
+        "short_name": _as_optional_str(source_dataset.get("short_name")),
+        "variable": latest.variable,
+        "period_type": _as_optional_str(source_dataset.get("period_type")) or "unknown",
+        "units": _as_optional_str(source_dataset.get("units")),
+        "resolution": _as_optional_str(source_dataset.get("resolution")),
+        "source": _as_optional_str(source_dataset.get("source")),
+        "source_url": _as_optional_str(source_dataset.get("source_url")),
+        "extent": latest.coverage,
+        "last_updated": latest.created_at,
+        "links": _dataset_links(dataset_id, latest),
+        "publication": DatasetPublication(
+            status=latest.publication.status,
+            published_at=latest.publication.published_at,
+        ),
+    }
+
+
 def _group_datasets() -> dict[str, list[ArtifactRecord]]:
     grouped: dict[str, list[ArtifactRecord]] = {}
     for record in _load_records():
@@ -474,20 +541,41 @@ def _group_datasets() -> dict[str, list[ArtifactRecord]]:
 
 def _next_period_start(latest_period_end: str, *, period_type: str) -> str:
     """Compute the next expected period start for supported source period types."""
-    if period_type == "hourly":
-        timestamp = datetime.fromisoformat(latest_period_end)
-        return (timestamp + timedelta(hours=1)).isoformat()
-    if period_type == "daily":
-        current = date.fromisoformat(latest_period_end)
-        return (current + timedelta(days=1)).isoformat()
-    if period_type == "monthly":
-        current = date.fromisoformat(f"{latest_period_end}-01")
-        year = current.year + (1 if current.month == 12 else 0)
-        month = 1 if current.month == 12 else current.month + 1
-        return f"{year:04d}-{month:02d}"
-    if period_type == "yearly":
-        return f"{int(latest_period_end) + 1:04d}"
-    raise HTTPException(status_code=400, detail=f"Sync is not implemented for period type '{period_type}'")
+    next_period_start = _NEXT_PERIOD_STARTS.get(period_type)
+    if next_period_start is None:
+        raise HTTPException(status_code=400, detail=f"Sync is not implemented for period type '{period_type}'")
+    return next_period_start(latest_period_end)
+
+
+def _next_hour_start(latest_period_end: str) -> str:
+    timestamp = datetime.fromisoformat(latest_period_end)
+    return (timestamp + timedelta(hours=1)).isoformat()
+
+
+def _next_day_start(latest_period_end: str) -> str:
+    current = date.fromisoformat(latest_period_end)
+    return (current + timedelta(days=1)).isoformat()
+
+
+def _next_month_start(latest_period_end: str) -> str:
+    current = date.fromisoformat(f"{latest_period_end}-01")
+    year = current.year + (1 if current.month == 12 else 0)
+    month = 1 if current.month == 12 else current.month + 1
+    return f"{year:04d}-{month:02d}"
+
+
+def _next_year_start(latest_period_end: str) -> str:
+    return f"{int(latest_period_end) + 1:04d}"
+
+
+_NEXT_PERIOD_STARTS: Mapping[str, Callable[[str], str]] = MappingProxyType(
+    {
+        "hourly": _next_hour_start,
+        "daily": _next_day_start,
+        "monthly": _next_month_start,
+        "yearly": _next_year_start,
+    }
+)
 
 
 def _dataset_links(dataset_id: str, latest: ArtifactRecord) -> list[DatasetAccessLink]:
@@ -2,6 +2,8 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 import eo_api.startup  # noqa: F401  # pyright: ignore[reportUnusedImport]
 from eo_api.data_registry import routes as dataset_template_routes
@@ -19,6 +21,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# compress JSON responses cheaply; Zarr chunks and NetCDF downloads are already compressed on disk
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_content_types=(*DEFAULT_EXCLUDED_CONTENT_TYPES, "application/octet-stream", "application/x-netcdf"),
+)
 
 app.include_router(system_routes.router, tags=["System"])
 app.include_router(extent_routes.router, prefix="/extents", tags=["Extents"])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from datetime import UTC, datetime
 from importlib import import_module
@@ -10,10 +11,10 @@ from typing import Any, cast
 from zlib import adler32
 
 import xarray as xr
-import yaml
 
 from eo_api.data_manager.services.utils import get_lon_lat_dims, get_time_dim
 from eo_api.ingestions.schemas import ArtifactFormat, ArtifactRecord, PublicationStatus
+from eo_api.shared.yaml_io import dump_yaml, load_yaml
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data"
 CONFIG_DIR = Path(__file__).resolve().parent.parent.parent.parent / "config" / "pygeoapi"
@@ -22,6 +23,12 @@ PYGEOAPI_DIR = DATA_DIR / "pygeoapi"
 PYGEOAPI_CONFIG_PATH = PYGEOAPI_DIR / "pygeoapi-config.yml"
 PYGEOAPI_OPENAPI_PATH = PYGEOAPI_DIR / "pygeoapi-openapi.yml"
 
+CRS84 = "http://www.opengis.net/def/crs/OGC/1.3/CRS84"
+_PROVIDER_FORMATS: dict[ArtifactFormat, dict[str, str]] = {
+    ArtifactFormat.ZARR: {"name": "zarr", "mimetype": "application/zip"},
+    ArtifactFormat.NETCDF: {"name": "netcdf", "mimetype": "application/x-netcdf"},
+}
+
 
 def ensure_pygeoapi_base_config() -> Path:
     """Ensure the generated pygeoapi config exists and is discoverable."""
@@ -69,7 +76,7 @@ def _write_config(*, resources: dict[str, Any]) -> None:
     config["resources"] = resources
 
     PYGEOAPI_DIR.mkdir(parents=True, exist_ok=True)
-    PYGEOAPI_CONFIG_PATH.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    PYGEOAPI_CONFIG_PATH.write_text(dump_yaml(config, sort_keys=False), encoding="utf-8")
 
 
 def _sync_pygeoapi_documents(*, resources: dict[str, Any]) -> None:
@@ -104,7 +111,7 @@ def _build_collection_resource(record: ArtifactRecord) -> dict[str, Any]:
         "x_field": x_field,
         "y_field": y_field,
         "time_field": time_field,
-        "storage_crs": "http://www.opengis.net/def/crs/OGC/1.3/CRS84",
+        "storage_crs": CRS84,
         "format": _provider_format(record.format),
     }
     if record.format == ArtifactFormat.ZARR:
@@ -126,7 +133,7 @@ def _build_collection_resource(record: ArtifactRecord) -> dict[str, Any]:
         "extents": {
             "spatial": {
                 "bbox": [bbox.xmin, bbox.ymin, bbox.xmax, bbox.ymax],
-                "crs": "http://www.opengis.net/def/crs/OGC/1.3/CRS84",
+                "crs": CRS84,
             },
             "temporal": {"begin": temporal.start, "end": temporal.end},
         },
@@ -135,18 +142,26 @@ def _build_collection_resource(record: ArtifactRecord) -> dict[str, Any]:
 
 
 def _provider_format(artifact_format: ArtifactFormat) -> dict[str, str]:
-    if artifact_format == ArtifactFormat.ZARR:
-        return {"name": "zarr", "mimetype": "application/zip"}
-    return {"name": "netcdf", "mimetype": "application/x-netcdf"}
+    # copy, since a dict shared between resources would be dumped as a YAML anchor and alias
+    return dict(_PROVIDER_FORMATS[artifact_format])
 
 
 def _provider_axes(record: ArtifactRecord) -> tuple[str, str, str]:
     """Inspect an artifact and return provider axis field names."""
     data_path = record.path or record.asset_paths[0]
-    if record.format == ArtifactFormat.ZARR:
-        ds = xr.open_zarr(data_path, consolidated=True)
+    # every publish rebuilds all collections, so reuse axes of artifacts that have not been rewritten
+    return _read_provider_axes(data_path, record.format, Path(data_path).stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_provider_axes(data_path: str, artifact_format: ArtifactFormat, mtime_ns: int) -> tuple[str, str, str]:
+    """Open an artifact once per modification time to read its axis field names."""
+    del mtime_ns  # only used as part of the cache key
+    # only dimension names are needed, so skip dask chunking and value decoding
+    if artifact_format == ArtifactFormat.ZARR:
+        ds = xr.open_zarr(data_path, consolidated=True, chunks=None, decode_cf=False)
     else:
-        ds = xr.open_dataset(data_path)
+        ds = xr.open_dataset(data_path, decode_cf=False)
 
     try:
         x_field, y_field = get_lon_lat_dims(ds)
@@ -161,14 +176,19 @@ def _collection_id_for(record: ArtifactRecord) -> str:
     if record.request_scope.extent_id:
         scope_key = record.request_scope.extent_id
     elif record.request_scope.bbox:
-        bbox = ",".join(f"{value:.6f}" for value in record.request_scope.bbox)
-        scope_hash = f"{adler32(bbox.encode('utf-8')):08x}"
-        scope_key = f"bbox_{scope_hash}"
+        scope_key = _bbox_scope_key(record.request_scope.bbox)
     else:
         scope_key = "global"
     return f"{record.dataset_id}_{scope_key}"
 
 
+@functools.lru_cache(maxsize=512)
+def _bbox_scope_key(bbox: tuple[float, float, float, float]) -> str:
+    """Hash a request bbox into a scope key once, since unpublished records are regrouped on every listing."""
+    formatted = ",".join(f"{value:.6f}" for value in bbox)
+    return f"bbox_{adler32(formatted.encode('utf-8')):08x}"
+
+
 def managed_dataset_id_for(record: ArtifactRecord) -> str:
     """Return the stable managed dataset id for a stored record."""
     return record.publication.collection_id or _collection_id_for(record)
@@ -193,4 +213,4 @@ def _native_dataset_href(dataset_id: str) -> str:
 
 def _load_base_config() -> dict[str, Any]:
     """Load the checked-in base pygeoapi config used for generated publication docs."""
-    return cast(dict[str, Any], yaml.safe_load(PYGEOAPI_BASE_CONFIG_PATH.read_text(encoding="utf-8")))
+    return cast(dict[str, Any], load_yaml(PYGEOAPI_BASE_CONFIG_PATH.read_text(encoding="utf-8")))
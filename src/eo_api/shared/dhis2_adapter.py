@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from typing import Any, cast
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
 
-from dhis2_client.client import DHIS2Client
+if TYPE_CHECKING:
+    from dhis2_client.client import DHIS2Client
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_DHIS2_TIMEOUT_SECONDS = float(os.getenv("DHIS2_HTTP_TIMEOUT_SECONDS", "30"))
@@ -25,26 +28,57 @@ def _normalized_base_url(raw_base_url: str) -> str:
     return normalized
 
 
-def create_client(*, timeout_seconds: float | None = None, retries: int | None = None) -> DHIS2Client:
-    """Create a configured DHIS2 client from environment variables."""
+@dataclass(frozen=True, slots=True)
+class _DHIS2Config:
+    """DHIS2 connection settings read from the environment."""
+
+    base_url: str
+    username: str
+    password: str
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> _DHIS2Config:
+    """Read and normalize the DHIS2 connection settings once per process."""
     base_url = os.environ.get("DHIS2_BASE_URL")
     username = os.environ.get("DHIS2_USERNAME")
     password = os.environ.get("DHIS2_PASSWORD")
     if not base_url or not username or not password:
         raise ValueError("DHIS2_BASE_URL, DHIS2_USERNAME and DHIS2_PASSWORD must be set")
+    return _DHIS2Config(base_url=_normalized_base_url(base_url), username=username, password=password)
+
+
+def reset_dhis2_config() -> None:
+    """Forget the cached DHIS2 settings and shared client, e.g. after changing the environment."""
+    _load_config.cache_clear()
+    get_client.cache_clear()
+
+
+def create_client(*, timeout_seconds: float | None = None, retries: int | None = None) -> DHIS2Client:
+    """Create a configured DHIS2 client from environment variables."""
+    # imported on first use, so processes that never talk to DHIS2 do not load the client and its HTTP stack
+    from dhis2_client.client import DHIS2Client
+
+    config = _load_config()
 
     timeout = DEFAULT_DHIS2_TIMEOUT_SECONDS if timeout_seconds is None else timeout_seconds
     retry_count = DEFAULT_DHIS2_RETRIES if retries is None else retries
 
     return DHIS2Client(
-        base_url=_normalized_base_url(base_url),
-        username=username,
-        password=password,
+        base_url=config.base_url,
+        username=config.username,
+        password=config.password,
         timeout=timeout,
         retries=retry_count,
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_client() -> DHIS2Client:
+    """Return a process-wide DHIS2 client, so repeated calls reuse its pooled HTTP connections."""
+    return create_client()
+
+
 def list_organisation_units(client: DHIS2Client, *, fields: str) -> list[dict[str, Any]]:
     """Fetch organisation units using raw endpoint control over fields."""
     response = client.get(
@@ -0,0 +1,13 @@
+"""Geometry helpers shared across EO API modules."""
+
+from typing import Any
+
+
+def features_bounds(features: list[dict[str, Any]]) -> list[float]:
+    """Return the ``[xmin, ymin, xmax, ymax]`` bounds of a list of GeoJSON features."""
+    # imported lazily, like geopandas elsewhere, to keep app startup light
+    import shapely
+    from shapely.geometry import shape
+
+    geometries = [shape(feature["geometry"]) for feature in features if feature.get("geometry")]
+    return [float(value) for value in shapely.total_bounds(geometries)]
@@ -0,0 +1,51 @@
+"""HTTP helpers shared across EO API routes."""
+
+import hashlib
+from collections.abc import Iterable
+from pathlib import Path
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# clients must revalidate, but may reuse their copy when the ETag still matches
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def etag_for_files(paths: Iterable[Path], *, scope: str = "") -> str:
+    """Return a weak ETag derived from the size and modification time of files, distinct per scope."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{scope};".encode())
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            digest.update(f"{path}:missing;".encode())
+            continue
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Return whether the request's If-None-Match header matches the given ETag.
+
+    Only call this once the resource is known to exist, since "*" matches any current representation.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # weak comparison, as required for If-None-Match
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """Return an empty 304 response carrying the current validators."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL})
+
+
+def set_cache_validators(response: Response, etag: str) -> None:
+    """Attach the ETag and revalidation policy to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
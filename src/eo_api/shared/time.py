@@ -1,15 +1,15 @@
 """Time helpers shared across EO API modules."""
 
-from typing import Any
+from typing import Any, Literal
 
 import numpy as np
 
+# Map periods to datetime units: YYYY-MM-DDTHH (h), YYYY-MM-DD (D), etc.
+_PERIOD_UNITS: dict[str, Literal["h", "D", "M", "Y"]] = {"hourly": "h", "daily": "D", "monthly": "M", "yearly": "Y"}
+
 
 def numpy_datetime_to_period_string(datetimes: np.ndarray[Any, Any], period_type: str) -> np.ndarray[Any, Any]:
     """Convert an array of numpy datetimes to truncated period strings."""
     # TODO: this and numpy_period_string should be merged
-    s = np.datetime_as_string(datetimes, unit="s")
-
-    # Map periods to string lengths: YYYY-MM-DDTHH (13), YYYY-MM-DD (10), etc.
-    lengths = {"hourly": 13, "daily": 10, "monthly": 7, "yearly": 4}
-    return s.astype(f"U{lengths[period_type]}")
+    # formatting at the period unit truncates in C, without an intermediate full-precision string array
+    return np.datetime_as_string(datetimes, unit=_PERIOD_UNITS[period_type])
@@ -0,0 +1,21 @@
+"""YAML helpers that use the libyaml bindings when PyYAML was built with them."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+
+def load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a YAML document with the safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, *, sort_keys: bool = True) -> str:
+    """Serialize data to a YAML document with the safe dumper."""
+    return yaml.dump(data, Dumper=SafeDumper, sort_keys=sort_keys)  # type: ignore[no-any-return]
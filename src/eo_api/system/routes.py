@@ -1,5 +1,6 @@
 """Root API endpoints."""
 
+import functools
 import sys
 from importlib.metadata import version
 
@@ -35,6 +36,12 @@ def health() -> HealthStatus:
 @router.get("/info")
 def info() -> AppInfo:
     """Return application version and environment info."""
+    return _app_info()
+
+
+@functools.lru_cache(maxsize=1)
+def _app_info() -> AppInfo:
+    """Resolve package versions once, since installed distributions do not change at runtime."""
     return AppInfo(
         app_version=version("eo-api"),
         python_version=sys.version,
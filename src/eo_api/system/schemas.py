@@ -2,7 +2,7 @@
 
 from enum import StrEnum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StatusMessage(BaseModel):
@@ -43,6 +43,9 @@ class RootResponse(BaseModel):
 class AppInfo(BaseModel):
     """Application version and environment info."""
 
+    # frozen, since /info hands the same cached instance to every request
+    model_config = ConfigDict(frozen=True)
+
     app_version: str
     python_version: str
     titiler_version: str
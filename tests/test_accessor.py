@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from eo_api.data_accessor.services import accessor
+from eo_api.data_manager.services import downloader
+
+DATASET = {"id": "precip_daily", "period_type": "daily", "variable": "precip"}
+
+
+def _raster(fill_value: float) -> xr.Dataset:
+    return xr.Dataset(
+        {"precip": (("time", "lat", "lon"), np.full((2, 2, 2), fill_value))},
+        coords={
+            "time": pd.date_range("2024-01-01", periods=2),
+            "lat": [8.0, 7.0],
+            "lon": [-12.0, -11.0],
+        },
+    )
+
+
+def _bump_mtime(path: Path) -> None:
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_netcdf_cache_files_can_be_overwritten_after_reads(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(downloader, "DOWNLOAD_DIR", tmp_path)
+    cache_file = tmp_path / "precip_daily_2024-01.nc"
+    _raster(1.0).to_netcdf(cache_file)
+
+    coverage = accessor.get_data_coverage(DATASET)
+    _raster(2.0).to_netcdf(cache_file)
+
+    assert coverage["coverage"]["temporal"] == {"start": "2024-01-01", "end": "2024-01-02"}
+    assert float(accessor.get_data(DATASET)["precip"].max()) == 2.0
+
+
+def test_zarr_handle_is_replaced_when_the_archive_changes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(downloader, "DOWNLOAD_DIR", tmp_path)
+    zarr_path = tmp_path / "precip_daily.zarr"
+    _raster(1.0).to_zarr(zarr_path, mode="w", consolidated=True)
+    opened: list[str] = []
+    open_zarr = xr.open_zarr
+
+    def counting_open_zarr(store: str, **kwargs: Any) -> xr.Dataset:
+        opened.append(str(store))
+        ds: xr.Dataset = open_zarr(store, **kwargs)
+        return ds
+
+    monkeypatch.setattr(accessor.xr, "open_zarr", counting_open_zarr)
+
+    first = accessor.get_data(DATASET)
+    assert accessor.get_data(DATASET) is first
+    assert len(opened) == 1
+
+    _raster(2.0).to_zarr(zarr_path, mode="w", consolidated=True)
+    _bump_mtime(zarr_path)
+    second = accessor.get_data(DATASET)
+
+    assert second is not first
+    assert len(opened) == 2
+    assert float(second["precip"].max()) == 2.0
@@ -1,6 +1,9 @@
+import json
 from datetime import UTC, datetime
+from pathlib import Path
 
 import pytest
+from fastapi.testclient import TestClient
 
 from eo_api.ingestions import services
 from eo_api.ingestions.schemas import (
@@ -113,6 +116,47 @@ def test_list_datasets_groups_artifacts_by_managed_dataset_id(monkeypatch: pytes
     assert any(link.href == f"/zarr/{dataset.dataset_id}" for link in dataset.links)
 
 
+def test_list_datasets_returns_304_when_etag_matches(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(services, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(services, "ARTIFACTS_INDEX_PATH", tmp_path / "records.json")
+    monkeypatch.setattr(services, "_load_records", lambda: [_artifact(artifact_id="a1")])
+
+    first = client.get("/datasets")
+    etag = first.headers["etag"]
+    cached = client.get("/datasets", headers={"If-None-Match": etag})
+    (tmp_path / "records.json").write_text("[ ]\n", encoding="utf-8")
+    changed = client.get("/datasets", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_get_dataset_returns_404_before_checking_etag(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(services, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(services, "ARTIFACTS_INDEX_PATH", tmp_path / "records.json")
+    monkeypatch.setattr(services, "_load_records", lambda: [_artifact(artifact_id="a1")])
+
+    list_etag = client.get("/datasets").headers["etag"]
+    found = client.get("/datasets/chirps3_precipitation_daily_sle")
+    cached = client.get("/datasets/chirps3_precipitation_daily_sle", headers={"If-None-Match": "*"})
+    missing_any = client.get("/datasets/does-not-exist", headers={"If-None-Match": "*"})
+    missing_list_etag = client.get("/datasets/does-not-exist", headers={"If-None-Match": list_etag})
+
+    assert found.status_code == 200
+    assert found.headers["etag"] != list_etag
+    assert cached.status_code == 304
+    assert missing_any.status_code == 404
+    assert missing_list_etag.status_code == 404
+
+
 def test_sync_dataset_returns_up_to_date_when_no_new_period_is_due(monkeypatch: pytest.MonkeyPatch) -> None:
     dataset_id = "chirps3_precipitation_daily_sle"
     monkeypatch.setattr(
@@ -168,3 +212,51 @@ def test_managed_dataset_id_prefers_extent_id_when_present() -> None:
     artifact = _artifact(artifact_id="a1")
 
     assert managed_dataset_id_for(artifact) == "chirps3_precipitation_daily_sle"
+
+
+def test_load_records_backfills_legacy_records(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    legacy = _artifact(artifact_id="a1").model_dump(mode="json")
+    del legacy["request_scope"]
+    index_path = tmp_path / "records.json"
+    index_path.write_text(json.dumps([legacy]), encoding="utf-8")
+    monkeypatch.setattr(services, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(services, "ARTIFACTS_INDEX_PATH", index_path)
+
+    records = services._load_records()
+
+    assert [record.artifact_id for record in records] == ["a1"]
+    assert records[0].request_scope.start == "2026-01-01"
+    assert records[0].request_scope.bbox == (1.0, 2.0, 3.0, 4.0)
+
+
+def test_load_records_rereads_index_after_it_changes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    index_path = tmp_path / "records.json"
+    monkeypatch.setattr(services, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(services, "ARTIFACTS_INDEX_PATH", index_path)
+    services._save_records([_artifact(artifact_id="a1")])
+
+    first = services._load_records()
+    services._save_records([*first, _artifact(artifact_id="a2")])
+    second = services._load_records()
+
+    assert [record.artifact_id for record in first] == ["a1"]
+    assert [record.artifact_id for record in second] == ["a1", "a2"]
+
+
+def test_zarr_store_file_returns_304_when_etag_matches(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store = tmp_path / "store.zarr"
+    store.mkdir()
+    (store / "zarr.json").write_text('{"zarr_format": 3}', encoding="utf-8")
+    artifact = _artifact(artifact_id="a1").model_copy(update={"path": str(store), "asset_paths": [str(store)]})
+    monkeypatch.setattr(services, "get_latest_artifact_for_dataset_or_404", lambda _: artifact)
+
+    first = client.get("/zarr/chirps3_precipitation_daily_sle/zarr.json")
+    etag = first.headers["etag"]
+    cached = client.get("/zarr/chirps3_precipitation_daily_sle/zarr.json", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json() == {"zarr_format": 3}
+    assert cached.status_code == 304
+    assert cached.content == b""
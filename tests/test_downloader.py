@@ -110,5 +110,60 @@ def test_download_dataset_returns_502_for_upstream_provider_failure(monkeypatch:
     assert "Upstream dataset download failed: provider timeout" == str(exc_info.value.detail)
 
 
+def test_bbox_from_env_parses_four_ordered_numbers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DOWNLOAD_BBOX", " -13.5, 6.9 ,-10.1,10 ")
+
+    assert downloader._bbox_from_env() == [-13.5, 6.9, -10.1, 10.0]
+
+
+@pytest.mark.parametrize("raw_bbox", ["-13.5,6.9,-10.1", "west,6.9,-10.1,10", "-10.1,6.9,-13.5,10"])
+def test_bbox_from_env_rejects_malformed_values(monkeypatch: pytest.MonkeyPatch, raw_bbox: str) -> None:
+    monkeypatch.setenv("DOWNLOAD_BBOX", raw_bbox)
+
+    with pytest.raises(ValueError, match="DOWNLOAD_BBOX"):
+        downloader._bbox_from_env()
+
+
+def test_default_bbox_is_refetched_after_the_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    fetches: list[int] = []
+    now = [0.0]
+    monkeypatch.setattr(downloader, "DEFAULT_BBOX_TTL_SECONDS", 60.0)
+    monkeypatch.setattr(downloader.time, "monotonic", lambda: now[0])
+
+    def fake_fetch() -> tuple[float, ...]:
+        fetches.append(1)
+        return (1.0, 2.0, 3.0, 4.0)
+
+    monkeypatch.setattr(downloader, "_fetch_default_bbox_uncached", fake_fetch)
+    downloader._fetch_default_bbox.cache_clear()
+
+    downloader._get_default_bbox()
+    now[0] = 59.0
+    downloader._get_default_bbox()
+    assert len(fetches) == 1
+
+    now[0] = 61.0
+    assert downloader._get_default_bbox() == [1.0, 2.0, 3.0, 4.0]
+    assert len(fetches) == 2
+    downloader._fetch_default_bbox.cache_clear()
+
+
+@pytest.mark.parametrize("ttl_seconds", [0.0, -5.0])
+def test_default_bbox_is_not_reused_without_a_positive_ttl(monkeypatch: pytest.MonkeyPatch, ttl_seconds: float) -> None:
+    fetches: list[int] = []
+    monkeypatch.setattr(downloader, "DEFAULT_BBOX_TTL_SECONDS", ttl_seconds)
+
+    def fake_fetch() -> tuple[float, ...]:
+        fetches.append(1)
+        return (1.0, 2.0, 3.0, 4.0)
+
+    monkeypatch.setattr(downloader, "_fetch_default_bbox_uncached", fake_fetch)
+
+    downloader._get_default_bbox()
+    downloader._get_default_bbox()
+
+    assert len(fetches) == 2
+
+
 def _raise_default_bbox_error() -> list[float]:
     raise RuntimeError("missing default bbox")
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pytest
+
+from eo_api.data_registry.services import datasets
+
+
+def test_registry_entry_without_id_does_not_break_listing(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "datasets.yaml").write_text(
+        "- id: chirps3_precipitation_daily\n  variable: precip\n- name: Missing id\n  variable: t2m\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(datasets, "CONFIGS_DIR", tmp_path)
+
+    listed = datasets.list_datasets()
+
+    assert [dataset.get("name") for dataset in listed] == [None, "Missing id"]
+    assert datasets.get_dataset("chirps3_precipitation_daily") == listed[0]
+    assert datasets.get_dataset("Missing id") is None